@@ -1,10 +1,52 @@
 import argparse
+import sys
 from pathlib import Path
+from xml.etree import ElementTree
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import yfinance as yf
-from textblob import TextBlob
+import textblob
+from textblob._text import (
+    ABBREVIATIONS,
+    EMOTICONS,
+    PUNCTUATION,
+    RE_ABBR1,
+    RE_ABBR2,
+    RE_ABBR3,
+    RE_EMOTICONS,
+    RE_SARCASM,
+    replacements as CONTRACTIONS,
+)
+try:
+    import joblib
+except Exception:  # pragma: no cover - optional dependency
+    joblib = None
+
+# `python scripts/<name>.py` only puts scripts/ on sys.path; add the repo root for `src`.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src._price_cache import download_prices, slice_ticker
+
+# Same lexicon and rules TextBlob's default PatternAnalyzer uses for plain strings.
+SENTIMENT_XML = Path(textblob.__file__).parent / "en" / "en-sentiment.xml"
+NEGATIONS = frozenset(("no", "not", "n't", "never"))
+# Tokenizer tables from textblob._text.find_tokens; periods are handled separately.
+LEADING_PUNCTUATION = tuple(PUNCTUATION.replace(".", ""))
+TRAILING_PUNCTUATION = LEADING_PUNCTUATION + (".",)
+QUOTES = ("\u201c", "\u201d", "\u2018", "\u2019", "'", '"')
+# Emoticon -> polarity, compared lowercased like Sentiment.assessments does.
+EMOTICON_POLARITY: dict[str, float] = {}
+for (_mood, _p), _faces in EMOTICONS.items():
+    for _face in _faces:
+        EMOTICON_POLARITY.setdefault(_face.lower(), _p)
+# Filled on first use by load_sentiment_lexicon().
+_LEXICON: tuple[dict[str, float], dict[str, float], frozenset[str]] | None = None
+# Below this many headlines, worker start-up costs more than scoring serially.
+PARALLEL_MIN_HEADLINES = 50_000
+# Worker processes for headline scoring; -1 uses every CPU joblib can see.
+PARALLEL_N_JOBS = -1
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,6 +82,12 @@ def parse_args() -> argparse.Namespace:
             "1 = next-day return, etc.)"
         ),
     )
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=PARALLEL_N_JOBS,
+        help="Worker processes for scoring large headline sets (-1 = all CPUs)",
+    )
     return parser.parse_args()
 
 
@@ -56,63 +104,234 @@ def load_news(path: str | Path) -> pd.DataFrame:
     if missing:
         raise ValueError(f"News CSV is missing required columns: {sorted(missing)}")
 
-    df = df.copy()
-    df["headline"] = df["headline"].astype(str).fillna("")
+    # Fill before casting; astype(str) alone would turn missing headlines into "nan".
+    df["headline"] = df["headline"].fillna("").astype(str)
     df["stock"] = df["stock"].astype(str).str.upper().str.strip()
 
     # Parse timezone-aware datetimes when possible; dataset uses UTC-4 in source.
-    df["date"] = pd.to_datetime(df["date"], errors="coerce", utc=True)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce", utc=True, format="ISO8601", cache=True)
     df = df.dropna(subset=["date"])  # drop rows with unparseable dates
-    df["news_date"] = df["date"].dt.date
+    # Naive datetime64 day keys (not Python dates) so merges use the int64 join path.
+    df["news_date"] = df["date"].dt.tz_convert(None).dt.normalize()
     return df
 
 
-def compute_headline_sentiment(df: pd.DataFrame) -> pd.DataFrame:
-    def polarity(text: str) -> float:
-        try:
-            return float(TextBlob(text).sentiment.polarity)
-        except Exception:
-            return 0.0
+def _mean_pairs(pairs: list[tuple[float, float]]) -> tuple[float, float]:
+    return tuple(sum(col) / len(col) for col in zip(*pairs))
+
+
+def load_sentiment_lexicon() -> tuple[dict[str, float], dict[str, float], frozenset[str]]:
+    """Return ``(polarity, intensity, modifiers)`` keyed by lowercased word.
+
+    Scores are averaged over word senses and part-of-speech tags exactly as
+    ``textblob.en.sentiment`` does, including the derived ``-ly`` adverbs.
+    """
+
+    # Cached in a plain global rather than with lru_cache: when the script runs
+    # as __main__, loky pickles the scorer by value, and an lru_cache wrapper
+    # would be pickled by reference to a __main__ the workers do not have.
+    global _LEXICON
+    if _LEXICON is None:
+        _LEXICON = _read_sentiment_lexicon()
+    return _LEXICON
+
+
+def _read_sentiment_lexicon() -> tuple[dict[str, float], dict[str, float], frozenset[str]]:
+    senses: dict[str, dict[str | None, list[tuple[float, float]]]] = {}
+    for node in ElementTree.parse(SENTIMENT_XML).getroot().iter("word"):
+        form = node.attrib.get("form")
+        if not form:
+            continue
+        pair = (float(node.attrib.get("polarity", 0.0)), float(node.attrib.get("intensity", 1.0)))
+        senses.setdefault(form, {}).setdefault(node.attrib.get("pos"), []).append(pair)
+
+    words: dict[str, dict[str | None, tuple[float, float]]] = {}
+    for form, by_pos in senses.items():
+        tags = {pos: _mean_pairs(pairs) for pos, pairs in by_pos.items()}
+        tags[None] = _mean_pairs(list(tags.values()))
+        words[form] = tags
+
+    # Map "terrible" to the adverb "terribly", mirroring textblob.en.Sentiment.load.
+    for form, tags in list(words.items()):
+        if "JJ" in tags:
+            stem = form[:-1] + "i" if form.endswith("y") else form
+            stem = stem[:-2] if stem.endswith("le") else stem
+            adverb = words.setdefault(stem + "ly", {})
+            adverb["RB"] = adverb[None] = tags["JJ"]
+
+    polarity = {form: float(tags[None][0]) for form, tags in words.items()}
+    intensity = {form: float(tags[None][1]) for form, tags in words.items()}
+    modifiers = frozenset(form for form, tags in words.items() if "RB" in tags)
+    return polarity, intensity, modifiers
+
+
+def _is_abbreviation(t: str) -> bool:
+    return (
+        t in ABBREVIATIONS
+        or RE_ABBR1.match(t) is not None
+        or RE_ABBR2.match(t) is not None
+        or RE_ABBR3.match(t) is not None
+    )
+
 
-    out = df.copy()
-    out["sentiment"] = out["headline"].astype(str).apply(polarity)
-    return out
+def tokenize(text: str) -> list[str]:
+    """Lowercased word and punctuation tokens, as ``textblob._text.find_tokens``
+    followed by ``Sentiment.__call__`` would produce them for ``text``."""
+
+    for a, b in CONTRACTIONS.items():
+        text = text.replace(a, b)
+    for q in QUOTES:
+        text = text.replace(q, f" {q} ")
+
+    tokens: list[str] = []
+    for t in text.split():
+        if not (t.startswith(TRAILING_PUNCTUATION) or t.endswith(TRAILING_PUNCTUATION)):
+            tokens.append(t)
+            continue
+        while t.startswith(LEADING_PUNCTUATION) and t not in CONTRACTIONS:
+            tokens.append(t[0])
+            t = t[1:]
+        tail = []
+        while t.endswith(TRAILING_PUNCTUATION) and t not in CONTRACTIONS:
+            if t.endswith(LEADING_PUNCTUATION):
+                tail.append(t[-1])
+                t = t[:-1]
+            # Split an ellipsis before splitting a single period.
+            if t.endswith("..."):
+                tail.append("...")
+                t = t[:-3].rstrip(".")
+            if t.endswith("."):
+                if _is_abbreviation(t):
+                    break
+                tail.append(t[-1])
+                t = t[:-1]
+        if t:
+            tokens.append(t)
+        tokens.extend(reversed(tail))
+
+    # Re-join the sarcasm mark "( ! )" and emoticons split up above (": )" -> ":)").
+    joined = " ".join(tokens)
+    if "!" in joined:
+        joined = RE_SARCASM.sub("(!)", joined)
+    joined = RE_EMOTICONS.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), joined)
+    return joined.lower().split()
+
+
+def score_tokens(tokens: list[str]) -> float:
+    polarity, intensity, modifiers = load_sentiment_lexicon()
+
+    # Each assessment is [polarity, intensity, negated] for a known word,
+    # optionally preceded by a modifier ("very good") or negation ("not good").
+    assessments: list[list] = []
+    modifier: str | None = None
+    negated = False
+    for w in tokens:
+        if w in polarity:
+            if modifier is None:
+                assessments.append([polarity[w], intensity[w], False])
+            else:
+                last = assessments[-1]
+                last[0] = max(-1.0, min(polarity[w] * last[1], 1.0))
+                last[1] = intensity[w]
+            if negated:
+                assessments[-1][1] = 1.0 / assessments[-1][1]
+                assessments[-1][2] = True
+            modifier = w if w in modifiers else None
+            negated = w in NEGATIONS
+        else:
+            if w in NEGATIONS:
+                negated = True
+            elif negated and len(w.strip("'")) > 1:
+                # Negation is retained across small words ("not a good"), but
+                # not across longer tokens such as an ellipsis.
+                negated = False
+            if negated and modifier is not None and modifier.endswith("ly"):
+                # "really not good"
+                assessments[-1][2] = True
+                negated = False
+            elif modifier is not None and len(w) > 2:
+                modifier = None
+            if w == "!" and assessments:
+                assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+            if w == "(!)":
+                # Sarcasm mark: a neutral assessment that dilutes the average.
+                assessments.append([0.0, 1.0, False])
+            if not w.isalpha() and len(w) <= 5 and w not in PUNCTUATION and w in EMOTICON_POLARITY:
+                assessments.append([EMOTICON_POLARITY[w], 1.0, False])
+
+    if not assessments:
+        return 0.0
+    # "not good" = slightly bad, "not bad" = slightly good.
+    return sum(p * -0.5 if neg else p for p, _, neg in assessments) / len(assessments)
+
+
+def _polarity(text: str) -> float:
+    # Inputs are always str (see load_news), so an empty check is the only guard needed.
+    return score_tokens(tokenize(text)) if text else 0.0
+
+
+def _score_chunk(headlines: np.ndarray) -> np.ndarray:
+    # Straight into a float64 buffer, without pandas' per-element Series machinery.
+    # Only plain functions are referenced here: loky pickles this by value when
+    # the script runs as __main__, and ufuncs from np.frompyfunc cannot be pickled.
+    return np.fromiter(map(_polarity, headlines), dtype=np.float64, count=len(headlines))
+
+
+def score_headlines(headlines: np.ndarray, n_jobs: int | None = None) -> np.ndarray:
+    if joblib is None or len(headlines) < PARALLEL_MIN_HEADLINES:
+        return _score_chunk(headlines)
+    n_workers = joblib.effective_n_jobs(PARALLEL_N_JOBS if n_jobs is None else n_jobs)
+    if n_workers == 1:
+        return _score_chunk(headlines)
+
+    chunks = np.array_split(headlines, n_workers)
+    scores = joblib.Parallel(n_jobs=n_workers, backend="loky")(joblib.delayed(_score_chunk)(chunk) for chunk in chunks)
+    return np.concatenate(scores)
+
+
+def compute_headline_sentiment(df: pd.DataFrame, n_jobs: int | None = None) -> pd.DataFrame:
+    # Wire-service headlines repeat a lot: score each distinct one once and
+    # broadcast the scores back through the factorized codes.
+    codes, uniques = pd.factorize(df["headline"].astype(str))
+    # assign() only adds the new column instead of copying the whole frame first.
+    return df.assign(sentiment=score_headlines(uniques.to_numpy(dtype=object), n_jobs=n_jobs)[codes])
 
 
 def aggregate_daily_sentiment(df: pd.DataFrame) -> pd.DataFrame:
-    grouped = (
-        df.groupby(["stock", "news_date"], as_index=False)["sentiment"]
-        .agg(["mean", "count"])
-        .reset_index()
-    )
-    grouped = grouped.rename(
-        columns={
-            "stock": "ticker",
-            "news_date": "date",
-            "mean": "sentiment_mean",
-            "count": "n_articles",
+    # Factorize (stock, day) pairs once and reduce sum/count with bincount in a
+    # single linear pass, instead of a hash groupby plus MultiIndex round-trip.
+    keys = pd.MultiIndex.from_arrays([df["stock"], df["news_date"]])
+    codes, uniques = keys.factorize(sort=True)
+    counts = np.bincount(codes, minlength=len(uniques))
+    sums = np.bincount(codes, weights=df["sentiment"].to_numpy(dtype=np.float64), minlength=len(uniques))
+    return pd.DataFrame(
+        {
+            "ticker": uniques.get_level_values(0),
+            "date": uniques.get_level_values(1),
+            "sentiment_mean": sums / counts,
+            "n_articles": counts,
         }
     )
-    return grouped
 
 
-def download_price_data(ticker: str, period: str) -> pd.DataFrame:
-    df = yf.download(ticker, period=period, interval="1d", auto_adjust=False, progress=False)
-    if df.empty:
-        raise ValueError(f"No price data returned for ticker {ticker}")
-
-    df = df.rename(columns=str.title)
+def _slice_price_data(prices_all: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    df = slice_ticker(prices_all, ticker)
     df["return_1d"] = df["Close"].pct_change()
-    df["date"] = df.index.date
+    df["date"] = df.index.tz_localize(None).normalize()
     return df[["date", "Close", "return_1d"]].reset_index(drop=True)
 
 
+def download_price_data(ticker: str, period: str) -> pd.DataFrame:
+    return _slice_price_data(download_prices([ticker], period=period), ticker)
+
+
 def correlate_for_ticker(
     ticker: str,
     sentiment_daily: pd.DataFrame,
     period: str,
     out_dir: Path,
     lag_days: int = 0,
+    prices: pd.DataFrame | None = None,
 ) -> None:
     ticker = ticker.upper().strip()
     sent = sentiment_daily.loc[sentiment_daily["ticker"] == ticker].copy()
@@ -120,7 +339,8 @@ def correlate_for_ticker(
         # No sentiment for this ticker; nothing to do.
         return
 
-    prices = download_price_data(ticker, period=period)
+    if prices is None:
+        prices = download_price_data(ticker, period=period)
 
     merged = prices.merge(sent, on="date", how="left")
 
@@ -132,15 +352,18 @@ def correlate_for_ticker(
         ret_col = "return_1d"
 
     valid = merged.dropna(subset=["sentiment_mean", ret_col])
-    if not valid.empty:
-        corr_value = float(valid["sentiment_mean"].corr(valid[ret_col]))
-        n_obs = int(len(valid))
+    n_obs = int(len(valid))
+    if n_obs >= 2:
+        # `valid` is already NaN-free, so skip Series.corr's dispatch and masking.
+        x = valid["sentiment_mean"].to_numpy(dtype=np.float64)
+        y = valid[ret_col].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr_value = float(np.corrcoef(x, y)[0, 1])
     else:
         corr_value = float("nan")
-        n_obs = 0
 
-    sent.to_csv(out_dir / f"{ticker}_sentiment_by_day.csv", index=False)
-    merged.to_csv(out_dir / f"{ticker}_sentiment_returns.csv", index=False)
+    sent.to_parquet(out_dir / f"{ticker}_sentiment_by_day.parquet", engine="pyarrow", compression="zstd", index=False)
+    merged.to_parquet(out_dir / f"{ticker}_sentiment_returns.parquet", engine="pyarrow", compression="zstd", index=False)
 
     summary = pd.DataFrame(
         {
@@ -150,6 +373,7 @@ def correlate_for_ticker(
             "pearson_correlation": [corr_value],
         }
     )
+    # The one-row summary stays CSV; Parquet overhead is not worth it there.
     summary.to_csv(out_dir / f"{ticker}_correlation_summary.csv", index=False)
 
     if not valid.empty:
@@ -180,10 +404,17 @@ def main() -> None:
     out_dir = ensure_output_dir(args.output_dir)
 
     news = load_news(args.news_csv)
-    news_with_sentiment = compute_headline_sentiment(news)
+    news_with_sentiment = compute_headline_sentiment(news, n_jobs=args.n_jobs)
     daily_sentiment = aggregate_daily_sentiment(news_with_sentiment)
 
     tickers = [t.strip().upper() for t in args.tickers.split(",") if t.strip()]
+    # Tickers without any news are skipped, so there is no need to fetch their prices.
+    with_news = set(daily_sentiment["ticker"])
+    tickers = [t for t in tickers if t in with_news]
+    if not tickers:
+        return
+
+    prices_all = download_prices(tickers, period=args.period)
 
     for ticker in tickers:
         correlate_for_ticker(
@@ -192,6 +423,7 @@ def main() -> None:
             period=args.period,
             out_dir=out_dir,
             lag_days=args.lag_days,
+            prices=_slice_price_data(prices_all, ticker),
         )
 
 
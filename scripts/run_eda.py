@@ -1,12 +1,23 @@
 import argparse
+import re
+from datetime import timedelta, timezone, tzinfo
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
-from sklearn.decomposition import NMF
+from scipy import sparse
+from sklearn.decomposition import MiniBatchNMF
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+# Domain part of email-like publishers, e.g. "jj <jj@zacks.com>" -> "zacks.com".
+PUBLISHER_DOMAIN_RE = re.compile(r"@([^>\s]+)")
+# Trailing UTC offset after a time of day, e.g. "10:30:00-04:00" or "10:30Z".
+TZ_SUFFIX_RE = r"\d{2}:\d{2}(?::\d{2}(?:\.\d*)?)?\s*(?:Z|[+-]\d{2}(?::?\d{2})?)$"
+# Fixed offsets as written in the README, e.g. "UTC-4" or "UTC+05:30".
+UTC_OFFSET_RE = re.compile(r"^UTC([+-])(\d{1,2})(?::?(\d{2}))?$")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Task-1 EDA on financial news dataset")
@@ -14,6 +25,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output-dir", default="outputs/eda", help="Directory to store EDA outputs")
     parser.add_argument("--topics", type=int, default=10, help="Number of topics for NMF topic modeling")
     parser.add_argument("--max-features", type=int, default=5000, help="Max vocabulary size for TF-IDF")
+    parser.add_argument(
+        "--assume-tz",
+        default="UTC-4",
+        help="Timezone of naive timestamps (e.g. UTC-4 or America/New_York); when the CSV mixes naive and offset stamps, hours are reported in this zone",
+    )
     return parser.parse_args()
 
 
@@ -23,20 +39,44 @@ def ensure_output_dir(path: str | Path) -> Path:
     return out
 
 
-def load_data(csv_path: str) -> pd.DataFrame:
+def parse_tz(name: str) -> tzinfo | str:
+    match = UTC_OFFSET_RE.match(name)
+    if match is None:
+        return name  # IANA name such as "America/New_York"
+    sign = -1 if match.group(1) == "-" else 1
+    return timezone(sign * timedelta(hours=int(match.group(2)), minutes=int(match.group(3) or 0)))
+
+
+def _parse_mixed_dates(values: pd.Series, tz: tzinfo | str) -> pd.Series:
+    # Read naive stamps as wall time in `tz` and convert offset stamps to it, so
+    # hour and weekday stay on the source's local clock instead of moving to UTC.
+    values = values.astype(str)
+    has_offset = values.str.contains(TZ_SUFFIX_RE)
+    aware = pd.to_datetime(values.where(has_offset), errors="coerce", format="ISO8601", utc=True, cache=True)
+    naive = pd.to_datetime(values.where(~has_offset), errors="coerce", format="ISO8601", cache=True)
+    naive = naive.dt.tz_localize(tz, ambiguous="NaT", nonexistent="NaT")
+    return aware.dt.tz_convert(tz).where(has_offset, naive)
+
+
+def load_data(csv_path: str, assume_tz: str = "UTC-4") -> pd.DataFrame:
     df = pd.read_csv(csv_path)
     expected_cols = {"headline", "url", "publisher", "date", "stock"}
     missing = expected_cols.difference(df.columns)
     if missing:
         raise ValueError(f"Missing expected columns in CSV: {missing}")
 
-    # Parse date as datetime; errors='coerce' to drop bad rows
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # Parse date as datetime; errors='coerce' to drop bad rows. ISO8601 keeps
+    # pandas on its C parser instead of per-row dateutil inference.
+    try:
+        df["date"] = pd.to_datetime(df["date"], errors="coerce", format="ISO8601", cache=True)
+    except ValueError:
+        # Mixed UTC offsets (or naive and aware stamps) need a common timezone.
+        df["date"] = _parse_mixed_dates(df["date"], parse_tz(assume_tz))
     df = df.dropna(subset=["date", "headline"])
 
     # Basic derived columns
     df["headline_len"] = df["headline"].astype(str).str.len()
-    df["date_only"] = df["date"].dt.date
+    df["date_only"] = df["date"].dt.normalize()
     df["hour"] = df["date"].dt.hour
     df["day_of_week"] = df["date"].dt.day_name()
     return df
@@ -58,9 +98,14 @@ def descriptive_stats(df: pd.DataFrame, out_dir: Path) -> None:
     publishers.to_csv(out_dir / "top_publishers.csv", index=False)
 
 
+def _count_by(values: pd.Series, name: str) -> pd.DataFrame:
+    # value_counts is a single C pass; sort=False skips ranking by frequency.
+    return values.value_counts(sort=False).sort_index().rename_axis(name).reset_index(name="article_count")
+
+
 def time_series_analysis(df: pd.DataFrame, out_dir: Path) -> None:
-    per_day = df.groupby("date_only").size().rename("article_count").reset_index()
-    per_day.to_csv(out_dir / "articles_per_day.csv", index=False)
+    per_day = _count_by(df["date_only"], "date_only")
+    per_day.to_csv(out_dir / "articles_per_day.csv", index=False, date_format="%Y-%m-%d")
 
     plt.figure(figsize=(10, 4))
     sns.lineplot(data=per_day, x="date_only", y="article_count")
@@ -71,7 +116,7 @@ def time_series_analysis(df: pd.DataFrame, out_dir: Path) -> None:
     plt.savefig(out_dir / "articles_per_day.png")
     plt.close()
 
-    by_hour = df.groupby("hour").size().rename("article_count").reset_index()
+    by_hour = _count_by(df["hour"], "hour")
     by_hour.to_csv(out_dir / "articles_by_hour.csv", index=False)
 
     plt.figure(figsize=(8, 4))
@@ -81,7 +126,7 @@ def time_series_analysis(df: pd.DataFrame, out_dir: Path) -> None:
     plt.savefig(out_dir / "articles_by_hour.png")
     plt.close()
 
-    by_dow = df.groupby("day_of_week").size().rename("article_count").reset_index()
+    by_dow = _count_by(df["day_of_week"], "day_of_week")
     order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     by_dow["day_of_week"] = pd.Categorical(by_dow["day_of_week"], categories=order, ordered=True)
     by_dow = by_dow.sort_values("day_of_week")
@@ -97,10 +142,11 @@ def time_series_analysis(df: pd.DataFrame, out_dir: Path) -> None:
 
 
 def publisher_analysis(df: pd.DataFrame, out_dir: Path) -> None:
-    # If publishers look like emails, extract domain
-    publishers = df["publisher"].astype(str)
-    domains = publishers.str.extract(r"@(?P<domain>[^>\s]+)")
-    df["publisher_domain"] = domains["domain"]
+    # If publishers look like emails, extract domain.  There are only a few
+    # hundred distinct publishers, so match each once and broadcast by code.
+    codes, uniques = pd.factorize(df["publisher"].astype(str))
+    domains = [m.group(1) if (m := PUBLISHER_DOMAIN_RE.search(p)) else None for p in uniques]
+    df["publisher_domain"] = np.array(domains, dtype=object)[codes]
 
     domain_counts = (
         df.dropna(subset=["publisher_domain"])
@@ -113,44 +159,48 @@ def publisher_analysis(df: pd.DataFrame, out_dir: Path) -> None:
     domain_counts.to_csv(out_dir / "publisher_domains.csv", index=False)
 
 
-def text_ngrams(df: pd.DataFrame, out_dir: Path, max_features: int = 5000) -> None:
-    headlines = df["headline"].astype(str).tolist()
+def build_tfidf(df: pd.DataFrame, max_features: int = 5000) -> tuple[sparse.csr_matrix, np.ndarray]:
+    # Fit once and share the matrix between n-gram ranking and topic modelling.
     vectorizer = TfidfVectorizer(
         ngram_range=(1, 2),
         max_features=max_features,
         stop_words="english",
         min_df=5,
     )
-    X = vectorizer.fit_transform(headlines)
+    X = vectorizer.fit_transform(df["headline"].astype(str))
     vocab = vectorizer.get_feature_names_out()
+    return X, vocab
 
-    # Compute mean TF-IDF score per term as a rough importance ranking
-    import numpy as np
 
-    mean_scores = X.mean(axis=0).A1
-    top_idx = mean_scores.argsort()[::-1][:100]
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    # argpartition selects the k largest in O(V); only those k get sorted.
+    k = min(k, scores.size)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(scores, -k)[-k:]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def text_ngrams(X: sparse.csr_matrix, vocab: np.ndarray, out_dir: Path) -> None:
+    # Compute mean TF-IDF score per term as a rough importance ranking
+    mean_scores = np.asarray(X.sum(axis=0)).ravel() / X.shape[0]
+    top_idx = top_k_indices(mean_scores, 100)
     top_terms = [(vocab[i], float(mean_scores[i])) for i in top_idx]
     pd.DataFrame(top_terms, columns=["term", "mean_tfidf"]).to_csv(out_dir / "top_ngrams.csv", index=False)
 
 
-def topic_modeling(df: pd.DataFrame, out_dir: Path, n_topics: int, max_features: int) -> None:
-    headlines = df["headline"].astype(str).tolist()
-    vectorizer = TfidfVectorizer(
-        ngram_range=(1, 2),
-        max_features=max_features,
-        stop_words="english",
-        min_df=5,
-    )
-    X = vectorizer.fit_transform(headlines)
-
-    nmf = NMF(n_components=n_topics, random_state=42)
+def topic_modeling(X: sparse.csr_matrix, vocab: np.ndarray, n_topics: int, out_dir: Path) -> None:
+    # MiniBatchNMF fits on row chunks and converges much faster on large sparse
+    # TF-IDF matrices. nndsvda needs n_topics <= min(n_samples, n_features), so
+    # small corpora fall back to random init, as NMF(init=None) used to.
+    init = "nndsvda" if n_topics <= min(X.shape) else "random"
+    nmf = MiniBatchNMF(n_components=n_topics, batch_size=1024, init=init, random_state=42, max_iter=200)
     W = nmf.fit_transform(X)
     H = nmf.components_
-    vocab = vectorizer.get_feature_names_out()
 
     top_terms_per_topic: list[list[str]] = []
     for topic_idx, topic_weights in enumerate(H):
-        top_indices = topic_weights.argsort()[::-1][:15]
+        top_indices = top_k_indices(topic_weights, 15)
         top_terms = [vocab[i] for i in top_indices]
         top_terms_per_topic.append(top_terms)
 
@@ -164,12 +214,13 @@ def main() -> None:
     args = parse_args()
     out_dir = ensure_output_dir(args.output_dir)
 
-    df = load_data(args.csv)
+    df = load_data(args.csv, assume_tz=args.assume_tz)
     descriptive_stats(df, out_dir)
     time_series_analysis(df, out_dir)
     publisher_analysis(df, out_dir)
-    text_ngrams(df, out_dir, max_features=args.max_features)
-    topic_modeling(df, out_dir, n_topics=args.topics, max_features=args.max_features)
+    X, vocab = build_tfidf(df, max_features=args.max_features)
+    text_ngrams(X, vocab, out_dir)
+    topic_modeling(X, vocab, n_topics=args.topics, out_dir=out_dir)
 
 
 if __name__ == "__main__":
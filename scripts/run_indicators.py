@@ -1,9 +1,10 @@
 import argparse
+import sys
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import yfinance as yf
 try:
     import pynance as pn
 except Exception:  # pragma: no cover - optional dependency
@@ -14,7 +15,21 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     talib = None
 
-import pandas_ta as ta
+# `python scripts/<name>.py` only puts scripts/ on sys.path; add the repo root for `src`.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src._price_cache import download_price_data, download_prices, slice_ticker
+
+try:
+    from src import _indicators_numba as nb
+except ImportError:  # pragma: no cover - optional dependency
+    nb = None
+
+try:
+    import pandas_ta as ta
+except ImportError:  # pragma: no cover - optional when TA-Lib or Numba is installed
+    ta = None
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,7 +37,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--tickers", required=True, help="Comma-separated list of ticker symbols, e.g. AAPL,MSFT")
     parser.add_argument("--period", default="1y", help="History window for yfinance (e.g. 6mo, 1y, 2y)")
     parser.add_argument("--interval", default="1d", help="Bar interval for yfinance (e.g. 1d, 1h)")
-    parser.add_argument("--output-dir", default="outputs/indicators", help="Directory to save indicator CSVs and plots")
+    parser.add_argument("--output-dir", default="outputs/indicators", help="Directory to save indicator Parquet files and plots")
     return parser.parse_args()
 
 
@@ -32,51 +47,85 @@ def ensure_output_dir(path: str | Path) -> Path:
     return out
 
 
-def download_price_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
-    df = yf.download(ticker, period=period, interval=interval, auto_adjust=False, progress=False)
-    if df.empty:
-        raise ValueError(f"No data returned for ticker {ticker}")
-    df = df.rename(columns=str.title)  # Ensure Open, High, Low, Close, Volume
-    return df
+MACD_COLUMNS = ["MACD", "MACD_signal", "MACD_hist"]
 
 
-def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    close = df["Close"]
+def _pandas_ta():
+    # Last resort when neither TA-Lib nor the Numba kernels are available.
+    if ta is None:
+        raise ImportError("Computing indicators needs TA-Lib, numba or pandas-ta; install one of them")
+    return ta
+
+
+def _sma(close: pd.Series) -> pd.Series:
+    if talib is not None:
+        return talib.SMA(close, timeperiod=20)
+    if nb is not None:
+        return pd.Series(nb.sma(close.to_numpy(dtype=np.float64), 20), index=close.index)
+    return _pandas_ta().sma(close, length=20)
+
+
+def _rsi(close: pd.Series) -> pd.Series:
+    if talib is not None:
+        return talib.RSI(close, timeperiod=14)
+    if nb is not None:
+        return pd.Series(nb.rsi(close.to_numpy(dtype=np.float64), 14), index=close.index)
+    return _pandas_ta().rsi(close, length=14)
+
 
+def _macd_frame(close: pd.Series) -> pd.DataFrame:
     if talib is not None:
-        df["SMA_20"] = talib.SMA(close, timeperiod=20)
-        df["RSI_14"] = talib.RSI(close, timeperiod=14)
-        macd, macd_signal, macd_hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
-        df["MACD"] = macd
-        df["MACD_signal"] = macd_signal
-        df["MACD_hist"] = macd_hist
+        macd = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+    elif nb is not None:
+        # Numba kernel: one tight loop instead of pandas-ta's three EWM passes
+        macd = nb.macd_onepass(close.to_numpy(dtype=np.float64), fast=12, slow=26, signal=9)
     else:
         # Fallback to pandas-ta
-        df["SMA_20"] = ta.sma(close, length=20)
-        df["RSI_14"] = ta.rsi(close, length=14)
-        macd = ta.macd(close, fast=12, slow=26, signal=9)
-        df["MACD"] = macd["MACD_12_26_9"]
-        df["MACD_signal"] = macd["MACDs_12_26_9"]
-        df["MACD_hist"] = macd["MACDh_12_26_9"]
+        macd = _pandas_ta().macd(close, fast=12, slow=26, signal=9)
+        macd = (macd["MACD_12_26_9"], macd["MACDs_12_26_9"], macd["MACDh_12_26_9"])
+    return pd.DataFrame(dict(zip(MACD_COLUMNS, (np.asarray(m) for m in macd))), index=close.index)
 
-    # Daily returns for potential correlation with future work
-    df["return_1d"] = df["Close"].pct_change()
 
+def _sharpe_ratio(returns: pd.Series) -> float:
     # Financial metric using PyNance when available: Sharpe ratio of daily returns
-    returns = df["return_1d"].dropna()
+    returns = returns.dropna()
     if pn is not None and hasattr(pn, "sharpe_ratio") and not returns.empty:
-        sharpe_value = float(pn.sharpe_ratio(returns, risk_free_rate=0.0))
-        df["sharpe_ratio"] = sharpe_value
+        return float(pn.sharpe_ratio(returns, risk_free_rate=0.0))
     elif not returns.empty:
         # Manual Sharpe ratio fallback: mean / std of daily returns (risk-free assumed 0)
-        sharpe_value = returns.mean() / returns.std(ddof=1)
-        df["sharpe_ratio"] = float(sharpe_value)
-    else:
-        df["sharpe_ratio"] = pd.NA
+        return float(returns.mean() / returns.std(ddof=1))
+    return pd.NA
 
+
+def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    close = df["Close"]
+    df["SMA_20"] = _sma(close)
+    df["RSI_14"] = _rsi(close)
+    df[MACD_COLUMNS] = _macd_frame(close)
+
+    # Daily returns for potential correlation with future work
+    df["return_1d"] = close.pct_change()
+    df["sharpe_ratio"] = _sharpe_ratio(df["return_1d"])
     return df
 
 
+def compute_indicators_by_ticker(prices: pd.DataFrame) -> pd.DataFrame:
+    """Same columns as :func:`compute_indicators` for a long ``ticker`` frame.
+
+    ``prices`` holds one row per (ticker, bar) with a unique index; every
+    ticker is handled in one groupby pass instead of a Python loop.
+    """
+
+    grouped = prices.groupby("ticker", sort=False)["Close"]
+    prices["SMA_20"] = grouped.transform(_sma)
+    prices["RSI_14"] = grouped.transform(_rsi)
+    prices[MACD_COLUMNS] = prices.groupby("ticker", sort=False, group_keys=False)["Close"].apply(_macd_frame)
+
+    prices["return_1d"] = grouped.pct_change()
+    prices["sharpe_ratio"] = prices.groupby("ticker", sort=False)["return_1d"].transform(_sharpe_ratio)
+    return prices
+
+
 def plot_indicators(ticker: str, df: pd.DataFrame, out_dir: Path) -> None:
     fig, (ax_price, ax_rsi, ax_macd) = plt.subplots(3, 1, figsize=(12, 8), sharex=True, gridspec_kw={"height_ratios": [3, 1, 1]})
 
@@ -105,11 +154,20 @@ def main() -> None:
     args = parse_args()
     out_dir = ensure_output_dir(args.output_dir)
     tickers = [t.strip().upper() for t in args.tickers.split(",") if t.strip()]
+    if not tickers:
+        return
+
+    prices_all = download_prices(tickers, period=args.period, interval=args.interval)
+
+    # Long format (one row per ticker and bar) so indicators run as one groupby.
+    frames = {ticker: slice_ticker(prices_all, ticker) for ticker in tickers}
+    index_name = frames[tickers[0]].index.name or "Date"
+    prices_long = pd.concat(frames, names=["ticker", index_name]).reset_index()
+    indicators = compute_indicators_by_ticker(prices_long)
 
-    for ticker in tickers:
-        df = download_price_data(ticker, period=args.period, interval=args.interval)
-        df = compute_indicators(df)
-        df.to_csv(out_dir / f"{ticker}_indicators.csv")
+    for ticker, df in indicators.groupby("ticker", sort=False):
+        df = df.drop(columns="ticker").set_index(index_name)
+        df.to_parquet(out_dir / f"{ticker}_indicators.parquet", engine="pyarrow", compression="zstd")
         plot_indicators(ticker, df, out_dir)
 
 
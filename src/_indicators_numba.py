@@ -0,0 +1,135 @@
+"""Numba kernels for the Task-2 indicators when TA-Lib is not installed.
+
+Each kernel walks the Close array once and follows TA-Lib's conventions:
+moving averages are seeded with a simple average of their first window,
+RSI uses Wilder smoothing, and leading values without a full window are
+``NaN``.  A ``NaN`` Close yields ``NaN`` and restarts the window, so the
+output recovers once enough valid bars follow it, as ``rolling`` does.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def sma(close: np.ndarray, n: int) -> np.ndarray:
+    """Simple moving average over a trailing window of ``n`` bars."""
+
+    out = np.full(close.shape[0], np.nan)
+    total = 0.0
+    count = 0  # valid bars since the last NaN
+    for i in range(close.shape[0]):
+        price = close[i]
+        if np.isnan(price):
+            total = 0.0
+            count = 0
+            continue
+        total += price
+        count += 1
+        if count > n:
+            total -= close[i - n]
+        if count >= n:
+            out[i] = total / n
+    return out
+
+
+@njit(cache=True)
+def rsi(close: np.ndarray, n: int) -> np.ndarray:
+    """Relative Strength Index with Wilder's running-average smoothing."""
+
+    out = np.full(close.shape[0], np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = np.nan
+    count = 0  # price changes since the last NaN
+    for i in range(close.shape[0]):
+        price = close[i]
+        if np.isnan(price):
+            prev = np.nan
+            count = 0
+            avg_gain = 0.0
+            avg_loss = 0.0
+            continue
+        if np.isnan(prev):
+            prev = price
+            continue
+        change = price - prev
+        prev = price
+        count += 1
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if count <= n:
+            # Seed both averages with the plain mean of the first n changes.
+            avg_gain += gain / n
+            avg_loss += loss / n
+        else:
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+        if count >= n:
+            total = avg_gain + avg_loss
+            out[i] = 100.0 * avg_gain / total if total != 0.0 else 0.0
+    return out
+
+
+@njit(cache=True)
+def macd_onepass(
+    close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram from a single pass over ``close``.
+
+    The fast and slow EMAs (``alpha = 2 / (n + 1)``) and the signal EMA of
+    the MACD line are all updated inside the same loop, so ``close`` is
+    read once and no intermediate EMA arrays are allocated.
+    """
+
+    size = close.shape[0]
+    macd_line = np.full(size, np.nan)
+    signal_line = np.full(size, np.nan)
+    hist = np.full(size, np.nan)
+
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_signal = 0.0
+
+    # Like TA-Lib, the fast EMA is seeded over the last `fast` bars of the slow
+    # EMA's seed window so both lines become valid on the same bar.
+    fast_start = slow - fast
+    j = -1  # position within the current run of valid bars
+    for i in range(size):
+        price = close[i]
+        if np.isnan(price):
+            j = -1
+            ema_fast = 0.0
+            ema_slow = 0.0
+            ema_signal = 0.0
+            continue
+        j += 1
+        if j < slow:
+            ema_slow += price / slow
+            if j >= fast_start:
+                ema_fast += price / fast
+        else:
+            ema_slow += alpha_slow * (price - ema_slow)
+            ema_fast += alpha_fast * (price - ema_fast)
+
+        if j < slow - 1:
+            continue
+        value = ema_fast - ema_slow
+
+        # The signal EMA is seeded with the mean of the first `signal` MACD values.
+        k = j - (slow - 1)
+        if k < signal:
+            ema_signal += value / signal
+        else:
+            ema_signal += alpha_signal * (value - ema_signal)
+        if k >= signal - 1:
+            macd_line[i] = value
+            signal_line[i] = ema_signal
+            hist[i] = value - ema_signal
+
+    return macd_line, signal_line, hist
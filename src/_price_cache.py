@@ -0,0 +1,92 @@
+"""Day-scoped Parquet cache for ``yfinance`` downloads.
+
+Both Task-2 and Task-3 scripts fetch prices through :func:`cached_download`,
+so a ticker list downloaded by one is served from disk to the other for the
+rest of the day.  :func:`slice_ticker` pulls one ticker's OHLCV frame out of
+a batched download; each script adds its own columns on top of that.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import yfinance as yf
+
+PRICE_CACHE_DIR = Path.home() / ".cache" / "price"
+
+
+def _has_prices_for_every_ticker(df: pd.DataFrame, tickers: list[str]) -> bool:
+    # A ticker whose fetch failed inside a batched download (rate limit,
+    # network error) still gets its columns, all NaN, so a non-empty frame is
+    # not enough: caching it would serve the failure for the rest of the day.
+    if not isinstance(df.columns, pd.MultiIndex):
+        return bool(df.notna().to_numpy().any())
+    present = set(df.columns.get_level_values(0))
+    return all(t in present and df[t].notna().to_numpy().any() for t in tickers)
+
+
+def cached_download(tickers: str, period: str, interval: str) -> pd.DataFrame:
+    """``yf.download`` grouped by ticker, cached per (tickers, period, interval, day)."""
+
+    # Prices only change once a day, so key the cache on today's date as well.
+    key = "|".join((tickers, period, interval, date.today().isoformat()))
+    path = PRICE_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+    if path.exists():
+        return pd.read_parquet(path)
+
+    df = yf.download(
+        tickers,
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        auto_adjust=False,
+        threads=True,
+        progress=False,
+    )
+    if _has_prices_for_every_ticker(df, tickers.split()):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename, so an interrupted write never
+        # leaves a truncated file behind that later runs would try to read.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, compression="zstd")
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return df
+
+
+def slice_ticker(prices_all: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """Rows for ``ticker`` with title-cased ``Open``/``High``/``Low``/``Close``/``Volume``.
+
+    Raises ``ValueError`` when the download holds no prices for ``ticker``.
+    """
+
+    # Downloads are grouped as (ticker, field) columns.
+    if isinstance(prices_all.columns, pd.MultiIndex):
+        if ticker not in prices_all.columns.get_level_values(0):
+            raise ValueError(f"No price data returned for ticker {ticker}")
+        prices_all = prices_all[ticker]
+    df = prices_all.dropna(how="all")
+    if df.empty:
+        raise ValueError(f"No price data returned for ticker {ticker}")
+    return df.rename(columns=str.title)
+
+
+def download_prices(tickers: list[str], period: str, interval: str = "1d") -> pd.DataFrame:
+    """One batched request for every ticker instead of a round-trip per symbol."""
+
+    return cached_download(" ".join(tickers), period=period, interval=interval)
+
+
+def download_price_data(ticker: str, period: str, interval: str = "1d") -> pd.DataFrame:
+    """Download (or load from cache) a single ticker's OHLCV frame."""
+
+    return slice_ticker(cached_download(ticker, period=period, interval=interval), ticker)
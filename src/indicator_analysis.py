@@ -7,6 +7,7 @@ notebooks, or other pipelines) without shelling out to the CLI.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
@@ -30,7 +31,7 @@ class IndicatorAnalysis:
     interval:
         Bar interval used by ``yfinance`` (for example ``"1d"`` or ``"1h"``).
     output_dir:
-        Directory where CSVs and plots will be written.
+        Directory where Parquet files and plots will be written.
     """
 
     tickers: List[str]
@@ -44,22 +45,33 @@ class IndicatorAnalysis:
         Returns a dictionary mapping ticker → enriched price/indicator
         DataFrame.  The implementation is intentionally thin and defers
         to the battle-tested functions in ``scripts.run_indicators``.
+
+        Tickers are downloaded and processed on a small thread pool, since
+        each one mostly waits on the network.  Plots are drawn on the calling
+        thread because pyplot's figure registry is not thread-safe.
         """
 
         out_dir = _ri.ensure_output_dir(self.output_dir)
+        # Normalise and drop duplicates ("AAPL" and "aapl") so each ticker's
+        # files are written by exactly one worker.
+        tickers = list(dict.fromkeys(t for t in (raw.strip().upper() for raw in self.tickers) if t))
         results: Dict[str, pd.DataFrame] = {}
-
-        for raw in self.tickers:
-            ticker = raw.strip().upper()
-            if not ticker:
-                continue
-
-            df = _ri.download_price_data(ticker, period=self.period, interval=self.interval)
-            df = _ri.compute_indicators(df)
-
-            df.to_csv(out_dir / f"{ticker}_indicators.csv")
-            _ri.plot_indicators(ticker, df, out_dir)
-
-            results[ticker] = df
-
-        return results
+        if not tickers:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as ex:
+            futures = {ex.submit(self._process_one, ticker, out_dir): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                df = future.result()
+                _ri.plot_indicators(ticker, df, out_dir)
+                results[ticker] = df
+
+        # Keep the caller's ticker order regardless of completion order.
+        return {ticker: results[ticker] for ticker in tickers}
+
+    def _process_one(self, ticker: str, out_dir: Path) -> pd.DataFrame:
+        df = _ri.download_price_data(ticker, period=self.period, interval=self.interval)
+        df = _ri.compute_indicators(df)
+        df.to_parquet(out_dir / f"{ticker}_indicators.parquet", engine="pyarrow", compression="zstd")
+        return df
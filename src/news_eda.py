@@ -36,12 +36,17 @@ class NewsEDA:
     max_features:
         Maximum vocabulary size for the TF-IDF vectorizer used in both
         n-gram analysis and topic modelling.
+    assume_tz:
+        Timezone of naive timestamps (``"UTC-4"`` for the source data).
+        When the CSV mixes naive and offset stamps, hours and weekdays are
+        reported in this zone.
     """
 
     csv_path: Path
     output_dir: Path
     topics: int = 10
     max_features: int = 5000
+    assume_tz: str = "UTC-4"
 
     def run(self) -> pd.DataFrame:
         """Execute the full EDA pipeline and return the processed DataFrame.
@@ -51,24 +56,21 @@ class NewsEDA:
         * load and clean the raw CSV;
         * compute descriptive statistics on headline length and publishers;
         * perform calendar and intraday time-series analysis;
-        * extract frequent n-grams with TF-IDF;
-        * fit an NMF topic model and save top terms per topic.
+        * fit a single TF-IDF matrix over the headlines;
+        * extract frequent n-grams from it;
+        * fit an NMF topic model on it and save top terms per topic.
         """
 
         # Ensure the output directory exists before writing artifacts.
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        df = _run_eda.load_data(str(self.csv_path))
+        df = _run_eda.load_data(str(self.csv_path), assume_tz=self.assume_tz)
         _run_eda.descriptive_stats(df, self.output_dir)
         _run_eda.time_series_analysis(df, self.output_dir)
         _run_eda.publisher_analysis(df, self.output_dir)
-        _run_eda.text_ngrams(df, self.output_dir, max_features=self.max_features)
-        _run_eda.topic_modeling(
-            df,
-            self.output_dir,
-            n_topics=self.topics,
-            max_features=self.max_features,
-        )
+        X, vocab = _run_eda.build_tfidf(df, max_features=self.max_features)
+        _run_eda.text_ngrams(X, vocab, self.output_dir)
+        _run_eda.topic_modeling(X, vocab, n_topics=self.topics, out_dir=self.output_dir)
         return df
 
     @staticmethod
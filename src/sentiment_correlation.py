@@ -7,6 +7,7 @@ for running the full pipeline from Python code.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -49,6 +50,10 @@ class SentimentCorrelationAnalysis:
         The returned frame contains ticker-level daily sentiment and
         article counts; correlation summaries and scatter plots are
         written to ``output_dir``.
+
+        Price downloads, the network-bound part of each ticker, run on a
+        small thread pool; merging, writing and plotting then happen on the
+        calling thread because pyplot is not thread-safe.
         """
 
         out_dir = _rc.ensure_output_dir(self.output_dir)
@@ -57,17 +62,27 @@ class SentimentCorrelationAnalysis:
         news_with_sentiment = _rc.compute_headline_sentiment(news)
         daily_sentiment = _rc.aggregate_daily_sentiment(news_with_sentiment)
 
-        for raw in self.tickers:
-            ticker = raw.strip().upper()
-            if not ticker:
-                continue
-
-            _rc.correlate_for_ticker(
-                ticker=ticker,
-                sentiment_daily=daily_sentiment,
-                period=self.period,
-                out_dir=out_dir,
-                lag_days=self.lag_days,
-            )
+        # Tickers without any news are skipped, so their prices are never fetched;
+        # duplicates are dropped so each ticker is downloaded and written once.
+        with_news = set(daily_sentiment["ticker"])
+        tickers = list(dict.fromkeys(t for t in (raw.strip().upper() for raw in self.tickers) if t in with_news))
+        if not tickers:
+            return daily_sentiment
+
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as ex:
+            prices = {
+                ticker: ex.submit(_rc.download_price_data, ticker, period=self.period)
+                for ticker in tickers
+            }
+
+            for ticker in tickers:
+                _rc.correlate_for_ticker(
+                    ticker=ticker,
+                    sentiment_daily=daily_sentiment,
+                    period=self.period,
+                    out_dir=out_dir,
+                    lag_days=self.lag_days,
+                    prices=prices[ticker].result(),
+                )
 
         return daily_sentiment
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from src.indicator_analysis import IndicatorAnalysis
 
@@ -42,5 +43,176 @@ def test_indicator_analysis_uses_compute_indicators(monkeypatch, tmp_path):
     for col in ["SMA_20", "RSI_14", "MACD", "MACD_signal", "MACD_hist", "return_1d"]:
         assert col in df.columns
 
-    # CSV artifact should be written for the ticker
-    assert (out_dir / "AAPL_indicators.csv").exists()
+    # Parquet artifact should be written for the ticker
+    assert (out_dir / "AAPL_indicators.parquet").exists()
+
+
+def test_price_downloads_are_cached(monkeypatch, tmp_path):
+    """A second download of the same ticker/period is served from Parquet.
+
+    Both scripts share one cache, so the Task-3 download below is a hit too.
+    """
+
+    from scripts import run_correlation as rc
+    from scripts import run_indicators as ri
+    from src import _price_cache
+
+    index = pd.date_range("2024-01-01", periods=5, freq="D", name="Date")
+    calls = []
+
+    def fake_yf_download(ticker, **kwargs):
+        calls.append(ticker)
+        return pd.DataFrame({"Close": np.arange(5, dtype=float)}, index=index)
+
+    cache_dir = tmp_path / "price"
+    monkeypatch.setattr(_price_cache, "PRICE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(_price_cache.yf, "download", fake_yf_download)
+
+    first = ri.download_price_data("AAPL", period="1y", interval="1d")
+    second = ri.download_price_data("AAPL", period="1y", interval="1d")
+    from_correlation = rc.download_price_data("AAPL", period="1y")
+
+    assert calls == ["AAPL"]
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+    assert from_correlation["Close"].tolist() == first["Close"].tolist()
+    # Only the finished Parquet file is left; the temporary write was renamed.
+    assert [p.suffix for p in cache_dir.iterdir()] == [".parquet"]
+
+
+def test_partial_batch_download_is_not_cached(monkeypatch, tmp_path):
+    """A batch where one ticker came back all-NaN is fetched again next time."""
+
+    from src import _price_cache
+
+    index = pd.date_range("2024-01-01", periods=5, freq="D", name="Date")
+    calls = []
+
+    def fake_yf_download(tickers, **kwargs):
+        calls.append(tickers)
+        columns = pd.MultiIndex.from_product([tickers.split(), ["Close"]])
+        df = pd.DataFrame(np.nan, index=index, columns=columns)
+        df[("AAPL", "Close")] = np.arange(5, dtype=float)
+        return df
+
+    cache_dir = tmp_path / "price"
+    monkeypatch.setattr(_price_cache, "PRICE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(_price_cache.yf, "download", fake_yf_download)
+
+    _price_cache.download_prices(["AAPL", "MSFT"], period="1y")
+    prices = _price_cache.download_prices(["AAPL", "MSFT"], period="1y")
+
+    assert calls == ["AAPL MSFT", "AAPL MSFT"]
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+    with pytest.raises(ValueError, match="MSFT"):
+        _price_cache.slice_ticker(prices, "MSFT")
+
+
+def test_numba_fallback_indicators(monkeypatch):
+    """Without TA-Lib, indicators come from the Numba kernels."""
+
+    pytest.importorskip("numba")
+    from scripts import run_indicators as ri
+
+    monkeypatch.setattr(ri, "talib", None)
+
+    index = pd.date_range("2024-01-01", periods=120, freq="D")
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(size=len(index)))
+    df = ri.compute_indicators(pd.DataFrame({"Close": close}, index=index))
+
+    expected_sma = pd.Series(close, index=index).rolling(20).mean()
+    np.testing.assert_allclose(df["SMA_20"], expected_sma)
+    assert df["RSI_14"].iloc[:14].isna().all()
+    assert df["RSI_14"].iloc[14:].between(0, 100).all()
+    assert df["MACD"].iloc[:33].isna().all()
+    np.testing.assert_allclose(df["MACD_hist"].iloc[33:], (df["MACD"] - df["MACD_signal"]).iloc[33:])
+
+
+def test_numba_kernels_restart_after_nan():
+    """A NaN Close only blanks the windows that contain it."""
+
+    pytest.importorskip("numba")
+    from src import _indicators_numba as nb
+
+    close = 100 + np.cumsum(np.random.default_rng(2).normal(size=120))
+    close[40] = np.nan
+    tail = close[41:]
+
+    np.testing.assert_allclose(nb.sma(close, 20), pd.Series(close).rolling(20).mean())
+    np.testing.assert_allclose(nb.rsi(close, 14)[41:], nb.rsi(tail, 14))
+    assert np.isnan(nb.rsi(close, 14)[40])
+    for full, fresh in zip(nb.macd_onepass(close), nb.macd_onepass(tail)):
+        assert np.isnan(full[40])
+        np.testing.assert_allclose(full[41:], fresh)
+    np.testing.assert_allclose(nb.macd_onepass(close)[0][:40], nb.macd_onepass(close[:40])[0])
+
+
+def test_compute_indicators_by_ticker_matches_per_ticker():
+    """The long-format groupby path equals running each ticker separately."""
+
+    from scripts import run_indicators as ri
+
+    index = pd.date_range("2024-01-01", periods=60, freq="D", name="Date")
+    rng = np.random.default_rng(1)
+    frames = {t: pd.DataFrame({"Close": 100 + np.cumsum(rng.normal(size=len(index)))}, index=index) for t in ["AAPL", "MSFT"]}
+
+    long = pd.concat(frames, names=["ticker", "Date"]).reset_index()
+    combined = ri.compute_indicators_by_ticker(long)
+
+    for ticker, frame in frames.items():
+        expected = ri.compute_indicators(frame.copy())
+        got = combined.loc[combined["ticker"] == ticker].drop(columns="ticker").set_index("Date")
+        pd.testing.assert_frame_equal(got, expected, check_freq=False)
+
+
+def test_indicator_analysis_multiple_tickers_keep_order(monkeypatch, tmp_path):
+    """Tickers processed on the thread pool come back in the caller's order."""
+
+    index = pd.date_range("2024-01-01", periods=40, freq="D")
+
+    def fake_download_price_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+        return pd.DataFrame({"Close": np.linspace(100, 100 + len(ticker), len(index))}, index=index)
+
+    monkeypatch.setattr("src.indicator_analysis._ri.download_price_data", fake_download_price_data)
+    monkeypatch.setattr("src.indicator_analysis._ri.plot_indicators", lambda ticker, df, out_dir: None)
+
+    tickers = ["MSFT", " nvda ", "", "AAPL"]
+    results = IndicatorAnalysis(tickers=tickers, output_dir=tmp_path).run()
+
+    assert list(results) == ["MSFT", "NVDA", "AAPL"]
+    for ticker in results:
+        assert (tmp_path / f"{ticker}_indicators.parquet").exists()
+
+
+def test_indicator_analysis_dedupes_tickers(monkeypatch, tmp_path):
+    """Tickers that normalise to the same symbol are downloaded once."""
+
+    index = pd.date_range("2024-01-01", periods=40, freq="D")
+    calls = []
+
+    def fake_download_price_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+        calls.append(ticker)
+        return pd.DataFrame({"Close": np.linspace(100, 110, len(index))}, index=index)
+
+    monkeypatch.setattr("src.indicator_analysis._ri.download_price_data", fake_download_price_data)
+    monkeypatch.setattr("src.indicator_analysis._ri.plot_indicators", lambda ticker, df, out_dir: None)
+
+    results = IndicatorAnalysis(tickers=["AAPL", "aapl", " AAPL "], output_dir=tmp_path).run()
+
+    assert list(results) == ["AAPL"]
+    assert calls == ["AAPL"]
+
+
+def test_main_without_tickers_skips_download(monkeypatch, tmp_path):
+    """An empty ``--tickers`` list exits before any price request."""
+
+    from scripts import run_indicators as ri
+
+    def fail_download(*args, **kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("download_prices should not be called")
+
+    monkeypatch.setattr(ri, "download_prices", fail_download)
+    monkeypatch.setattr(
+        "sys.argv", ["run_indicators.py", "--tickers", ",", "--output-dir", str(tmp_path / "out")]
+    )
+
+    ri.main()
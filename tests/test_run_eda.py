@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+
+def test_topic_modeling_with_more_topics_than_features(tmp_path):
+    """Small corpora still get a topic table when n_topics > min(X.shape)."""
+
+    from scripts import run_eda
+
+    words = ["stock", "shares", "earnings", "beat", "miss", "rally", "falls", "upgrade", "downgrade", "guidance", "revenue", "dividend"]
+    rng = np.random.default_rng(0)
+    headlines = [" ".join(rng.choice(words, size=4, replace=False)) for _ in range(60)]
+
+    X, vocab = run_eda.build_tfidf(pd.DataFrame({"headline": headlines}), max_features=12)
+    assert X.shape == (60, 12)
+
+    run_eda.topic_modeling(X, vocab, n_topics=14, out_dir=tmp_path)
+
+    topics = pd.read_csv(tmp_path / "topics_top_terms.csv")
+    assert topics["topic"].tolist() == list(range(14))
+
+
+def test_load_data_keeps_source_hours_for_mixed_offsets(tmp_path):
+    """Naive and -04:00 stamps together still report UTC-4 wall-clock hours."""
+
+    from scripts import run_eda
+
+    csv_path = tmp_path / "news.csv"
+    pd.DataFrame(
+        {
+            "headline": ["a", "b", "c"],
+            "url": ["u1", "u2", "u3"],
+            "publisher": ["p", "p", "p"],
+            "date": ["2020-06-05 10:30:00-04:00", "2020-06-05 09:00:00", "2020-06-08 16:15:00+00:00"],
+            "stock": ["AAPL", "AAPL", "AAPL"],
+        }
+    ).to_csv(csv_path, index=False)
+
+    df = run_eda.load_data(str(csv_path), assume_tz="UTC-4")
+
+    assert df["hour"].tolist() == [10, 9, 12]
+    assert df["day_of_week"].tolist() == ["Friday", "Friday", "Monday"]
+    assert df["date_only"].dt.strftime("%Y-%m-%d").tolist() == ["2020-06-05", "2020-06-05", "2020-06-08"]
@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from src.sentiment_correlation import SentimentCorrelationAnalysis
 
@@ -29,7 +32,7 @@ def test_sentiment_correlation_end_to_end(monkeypatch, tmp_path):
     # Two days of synthetic returns for AAPL
     price_df = pd.DataFrame(
         {
-            "date": [pd.Timestamp("2024-01-01").date(), pd.Timestamp("2024-01-02").date()],
+            "date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
             "Close": [100.0, 101.0],
             "return_1d": [float("nan"), 0.01],
         }
@@ -57,4 +60,114 @@ def test_sentiment_correlation_end_to_end(monkeypatch, tmp_path):
 
     # Check that correlation summary and merged data were written
     assert (out_dir / "AAPL_correlation_summary.csv").exists()
-    assert (out_dir / "AAPL_sentiment_returns.csv").exists()
+    assert (out_dir / "AAPL_sentiment_returns.parquet").exists()
+
+    # Both news days should line up with the synthetic price rows
+    merged = pd.read_parquet(out_dir / "AAPL_sentiment_returns.parquet")
+    assert merged["sentiment_mean"].notna().all()
+
+
+def test_headline_sentiment_matches_textblob():
+    """The lexicon scorer reproduces TextBlob's polarity for headlines."""
+
+    from textblob import TextBlob
+
+    from scripts import run_correlation as rc
+
+    headlines = [
+        "Great results",
+        "Terrible outlook",
+        "Apple isn't expected to post a good quarter",
+        "Shares are not bad at all!",
+        "Really not good news for U.S. banks",
+        "Very very strong earnings beat!!",
+        "Analysts remain extremely bullish on well-known chipmaker",
+        "Not... great",
+        "Why this stock is not... cheap",
+        "Nvidia beats estimates :)",
+        "Record quarter, great guidance (!)",
+        "\u201cGood\u201d numbers, e.g. Mr. Market's favourite :-D",
+        "",
+    ]
+    news = pd.DataFrame({"headline": headlines})
+
+    scored = rc.compute_headline_sentiment(news)
+
+    expected = [TextBlob(h).sentiment.polarity for h in headlines]
+    assert scored["sentiment"].tolist() == pytest.approx(expected)
+
+
+def test_headline_sentiment_parallel_matches_serial(monkeypatch):
+    """Chunked joblib scoring returns the same values in the same order."""
+
+    from scripts import run_correlation as rc
+
+    pytest.importorskip("joblib")
+    headlines = pd.DataFrame({"headline": ["Great results", "Terrible outlook", "Not bad!"] * 20})
+    serial = rc.compute_headline_sentiment(headlines)["sentiment"]
+
+    # Two workers even on a single-CPU runner, so chunks really cross processes.
+    monkeypatch.setattr(rc, "PARALLEL_MIN_HEADLINES", 1)
+    monkeypatch.setattr(rc, "PARALLEL_N_JOBS", 2)
+    parallel = rc.compute_headline_sentiment(headlines)["sentiment"]
+
+    assert parallel.tolist() == serial.tolist()
+
+
+def test_parallel_scoring_from_script_entry_point(tmp_path):
+    """``python scripts/run_correlation.py`` can ship scoring chunks to workers.
+
+    Run as a script the module is ``__main__``, so loky pickles the scoring
+    functions by value instead of by reference as in the test above.
+    """
+
+    pytest.importorskip("joblib")
+    from scripts import run_correlation as rc
+
+    n = rc.PARALLEL_MIN_HEADLINES
+    news_csv = tmp_path / "news.csv"
+    pd.DataFrame(
+        {
+            "headline": [f"Great results for company {i}" for i in range(n)],
+            "url": "u",
+            "publisher": "p",
+            "date": "2024-01-01T10:00:00",
+            "stock": "AAPL",
+        }
+    ).to_csv(news_csv, index=False)
+
+    script = Path(rc.__file__)
+    # MSFT has no news, so the run stops after scoring without any download.
+    proc = subprocess.run(
+        [sys.executable, str(script), "--news-csv", str(news_csv), "--tickers", "MSFT",
+         "--output-dir", str(tmp_path / "out"), "--n-jobs", "2"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_aggregate_daily_sentiment_matches_groupby():
+    """The bincount reduction yields the same per-day mean and count as groupby."""
+
+    from scripts import run_correlation as rc
+
+    days = pd.to_datetime(["2024-01-02", "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-02"])
+    news = pd.DataFrame(
+        {
+            "stock": ["MSFT", "AAPL", "MSFT", "AAPL", "AAPL"],
+            "news_date": days,
+            "sentiment": [0.1, 0.2, 0.3, 0.4, -0.5],
+        }
+    )
+
+    daily = rc.aggregate_daily_sentiment(news)
+
+    expected = (
+        news.groupby(["stock", "news_date"])["sentiment"]
+        .agg(["mean", "count"])
+        .reset_index()
+        .set_axis(["ticker", "date", "sentiment_mean", "n_articles"], axis=1)
+    )
+    pd.testing.assert_frame_equal(daily, expected)